@@ -5,7 +5,6 @@ import logging
 import re
 import sys
 import traceback
-from collections import OrderedDict
 from datetime import date, datetime, time, timezone
 from inspect import istraceback
 from typing import Any
@@ -109,6 +108,9 @@ class JsonFormatter(logging.Formatter):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._required_fields = _parse_style(self)
+        self._uses_asctime = "asctime" in self._required_fields
+        # json.dumps(cls=...) builds a new encoder for every record, reuse a single one instead
+        self._encoder = JsonFormatter.JsonEncoder(ensure_ascii=True)
 
     def format(self, record: logging.LogRecord) -> str:
         """Formats a log record and serializes to json"""
@@ -122,7 +124,7 @@ class JsonFormatter(logging.Formatter):
         else:
             record.message = record.getMessage()
 
-        if "asctime" in self._required_fields:
+        if self._uses_asctime:
             record.asctime = self.formatTime(record, self.datefmt)
 
         if record.exc_info and not message_dict.get("exc_info"):
@@ -132,7 +134,7 @@ class JsonFormatter(logging.Formatter):
         if record.stack_info and not message_dict.get("stack_info"):
             message_dict["stack_info"] = self.formatStack(record.stack_info)
 
-        log_record: dict[str, Any] = OrderedDict()
+        log_record: dict[str, Any] = {}
 
         for field in self._required_fields:
             log_record[field] = record.__dict__.get(field)
@@ -142,7 +144,7 @@ class JsonFormatter(logging.Formatter):
 
         log_record["timestamp"] = datetime.fromtimestamp(record.created, tz=timezone.utc)
 
-        return json.dumps(log_record, cls=JsonFormatter.JsonEncoder, ensure_ascii=True)
+        return self._encoder.encode(log_record)
 
 
 class ColoredFormatter(logging.Formatter):
@@ -170,6 +172,7 @@ class ColoredFormatter(logging.Formatter):
         }
 
         self._required_fields = _parse_style(self)
+        self._encoder = JsonFormatter.JsonEncoder(ensure_ascii=True)
 
     @classmethod
     def _esc(cls, *codes: int) -> str:
@@ -190,7 +193,7 @@ class ColoredFormatter(logging.Formatter):
         args.update(self._esc_codes)
 
         if extra:
-            args["extra"] = json.dumps(extra, cls=JsonFormatter.JsonEncoder, ensure_ascii=True)
+            args["extra"] = self._encoder.encode(extra)
 
         for field in self._required_fields:
             if field in extra:
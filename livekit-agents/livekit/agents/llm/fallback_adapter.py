@@ -200,7 +200,7 @@ class FallbackLLMStream(LLMStream):
             llm_status.recovering_task = asyncio.create_task(_recover_llm_task(llm))
 
     async def _run(self) -> None:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         all_failed = all(not llm_status.available for llm_status in self._fallback_adapter._status)
         if all_failed:
@@ -230,5 +230,5 @@ class FallbackLLMStream(LLMStream):
             self._try_recovery(llm)
 
         raise APIConnectionError(
-            f"all LLMs failed ({[llm.label for llm in self._fallback_adapter._llm_instances]}) after {time.time() - start_time} seconds"  # noqa: E501
+            f"all LLMs failed ({[llm.label for llm in self._fallback_adapter._llm_instances]}) after {time.perf_counter() - start_time} seconds"  # noqa: E501
         )
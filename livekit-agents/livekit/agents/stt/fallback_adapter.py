@@ -179,7 +179,7 @@ class FallbackAdapter(
         language: NotGivenOr[str] = NOT_GIVEN,
         conn_options: APIConnectOptions,
     ):
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         all_failed = all(not stt_status.available for stt_status in self._status)
         if all_failed:
@@ -207,7 +207,7 @@ class FallbackAdapter(
             self._try_recovery(stt=stt, buffer=buffer, language=language, conn_options=conn_options)
 
         raise APIConnectionError(
-            f"all STTs failed ({[stt.label for stt in self._stt_instances]}) after {time.time() - start_time} seconds"  # noqa: E501
+            f"all STTs failed ({[stt.label for stt in self._stt_instances]}) after {time.perf_counter() - start_time} seconds"  # noqa: E501
         )
 
     async def recognize(
@@ -250,7 +250,7 @@ class FallbackRecognizeStream(RecognizeStream):
         self._recovering_streams: list[RecognizeStream] = []
 
     async def _run(self) -> None:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         all_failed = all(not stt_status.available for stt_status in self._fallback_adapter._status)
         if all_failed:
@@ -340,7 +340,7 @@ class FallbackRecognizeStream(RecognizeStream):
         await asyncio.gather(*[stream.aclose() for stream in self._recovering_streams])
 
         raise APIConnectionError(
-            f"all STTs failed ({[stt.label for stt in self._fallback_adapter._stt_instances]}) after {time.time() - start_time} seconds"  # noqa: E501
+            f"all STTs failed ({[stt.label for stt in self._fallback_adapter._stt_instances]}) after {time.perf_counter() - start_time} seconds"  # noqa: E501
         )
 
     def _try_recovery(self, stt: STT) -> None:
@@ -251,7 +251,7 @@ class FallbackChunkedStream(ChunkedStream):
     async def _run(self) -> None:
         assert isinstance(self._tts, FallbackAdapter)
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         all_failed = all(not tts_status.available for tts_status in self._tts._status)
         if all_failed:
@@ -309,7 +309,7 @@ class FallbackChunkedStream(ChunkedStream):
             self._try_recovery(tts)
 
         raise APIConnectionError(
-            f"all TTSs failed ({[tts.label for tts in self._tts._tts_instances]}) after {time.time() - start_time} seconds"  # noqa: E501
+            f"all TTSs failed ({[tts.label for tts in self._tts._tts_instances]}) after {time.perf_counter() - start_time} seconds"  # noqa: E501
         )
 
 
@@ -440,7 +440,7 @@ class FallbackSynthesizeStream(SynthesizeStream):
             await utils.aio.cancel_and_wait(input_task)
 
     async def _run(self) -> None:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         all_failed = all(not tts_status.available for tts_status in self._fallback_adapter._status)
         if all_failed:
@@ -557,7 +557,7 @@ class FallbackSynthesizeStream(SynthesizeStream):
                 self._try_recovery(tts)
 
             raise APIConnectionError(
-                f"all TTSs failed ({[tts.label for tts in self._fallback_adapter._tts_instances]}) after {time.time() - start_time} seconds"  # noqa: E501
+                f"all TTSs failed ({[tts.label for tts in self._fallback_adapter._tts_instances]}) after {time.perf_counter() - start_time} seconds"  # noqa: E501
             )
         finally:
             await utils.aio.cancel_and_wait(input_task)
@@ -951,7 +951,7 @@ class AgentActivity(RecognitionHooks):
         # the user can edit it for the current generation, but changes will not be kept inside the
         # Agent.chat_ctx
         temp_mutable_chat_ctx = self._agent.chat_ctx.copy()
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             await self._agent.on_user_turn_completed(
                 temp_mutable_chat_ctx, new_message=user_message
@@ -962,7 +962,7 @@ class AgentActivity(RecognitionHooks):
             logger.exception("error occured during on_user_turn_completed")
             return
 
-        callback_duration = time.time() - start_time
+        callback_duration = time.perf_counter() - start_time
 
         if isinstance(self.llm, llm.RealtimeModel):
             # ignore stt transcription for realtime model